@@ -1,10 +1,18 @@
 import numpy as np
 import json
+import logging
 import os
+import atexit
+import threading
+import time
 from datetime import datetime
 from collections import defaultdict
 import random
 
+# Selection and reward updates run on the request/feedback path - emit through
+# the server's queued root handler with deferred %-formatting, not print
+log = logging.getLogger(__name__)
+
 class EpsilonGreedyBandit:
     """
     Epsilon-greedy multi-armed bandit for chunk selection.
@@ -30,7 +38,22 @@ class EpsilonGreedyBandit:
         self.exploration_count = 0
         self.exploitation_count = 0
         self.recent_rewards = []
-        
+
+        # Debounced persistence: updates set a dirty flag and a background
+        # flusher snapshots at most once per window instead of serializing the
+        # full state to disk on every rating
+        self._dirty = False
+
+        # Stats memoization: get_performance_stats is called by /bandit-stats,
+        # the feedback path and the judge, but its output only changes when a
+        # reward lands - cache it keyed on an update version
+        self._stats_version = 0
+        self._stats_cache = (None, -1)  # (stats dict, version it was built at)
+
+        flusher = threading.Thread(target=self._state_flusher, daemon=True)
+        flusher.start()
+        atexit.register(self._flush_on_exit)
+
         print("🎲 Epsilon-Greedy Bandit initialized")
         print(f"   Initial epsilon: {epsilon}")
         print(f"   Decay rate: {decay_rate}")
@@ -89,9 +112,13 @@ class EpsilonGreedyBandit:
         
         # Decay epsilon over time
         self._decay_epsilon()
-        
-        print(f"🎲 Ranked {len(chunks)} chunks (ε={self.epsilon:.3f})")
-        print(f"   Exploration: {self.exploration_count}, Exploitation: {self.exploitation_count}")
+
+        # Selection moved the exploration/exploitation counters and epsilon,
+        # all of which get_performance_stats reports
+        self._stats_version += 1
+
+        log.info("🎲 Ranked %d chunks (ε=%.3f) - exploration: %d, exploitation: %d",
+                 len(chunks), self.epsilon, self.exploration_count, self.exploitation_count)
         
         return ranked_chunks[:top_k]
     
@@ -132,17 +159,28 @@ class EpsilonGreedyBandit:
         
         self.total_interactions += 1
         
-        print(f"🎲 Updated bandit: chunk {chunk_id[:8]}... got {rating}★ (reward={reward:.2f})")
-        print(f"   Chunk avg: {np.mean(self.chunk_rewards[chunk_id]):.3f} ({len(self.chunk_rewards[chunk_id])} samples)")
+        log.info("🎲 Updated bandit: chunk %s... got %d★ (reward=%.2f, avg=%.3f over %d samples)",
+                 chunk_id[:8], rating, reward,
+                 np.mean(self.chunk_rewards[chunk_id]), len(self.chunk_rewards[chunk_id]))
         
         # Adaptive epsilon based on performance
         self._adapt_epsilon()
+
+        # Persisted by the background flusher rather than per update
+        self._dirty = True
+        self._stats_version += 1
     
     def get_performance_stats(self):
         """Get current bandit performance statistics"""
         if not self.recent_rewards:
             return {}
-        
+
+        # Reuse the last snapshot until another reward changes the tables -
+        # avoids re-scanning every chunk's reward list between updates
+        stats, version = self._stats_cache
+        if version == self._stats_version:
+            return stats
+
         total_chunks_learned = len(self.chunk_rewards)
         avg_recent_reward = np.mean(self.recent_rewards)
         exploration_rate = self.exploration_count / max(1, self.total_interactions)
@@ -155,8 +193,8 @@ class EpsilonGreedyBandit:
                 best_chunks.append((chunk_id, avg_reward, len(rewards)))
         
         best_chunks.sort(key=lambda x: x[1], reverse=True)
-        
-        return {
+
+        stats = {
             'total_interactions': self.total_interactions,
             'chunks_learned': total_chunks_learned,
             'avg_recent_reward': avg_recent_reward,
@@ -166,6 +204,8 @@ class EpsilonGreedyBandit:
             'best_chunks': best_chunks[:5],  # Top 5 chunks
             'queries_learned': len(self.query_chunk_rewards)
         }
+        self._stats_cache = (stats, self._stats_version)
+        return stats
     
     def _get_chunk_id(self, chunk):
         """Generate unique ID for chunk"""
@@ -196,6 +236,25 @@ class EpsilonGreedyBandit:
         elif recent_avg < older_avg - 0.1:
             self.epsilon = min(0.3, self.epsilon * 1.1)
     
+    def _state_flusher(self):
+        """Snapshot dirty state to disk at most once every 5 seconds"""
+        while True:
+            time.sleep(5)
+            if self._dirty:
+                self._dirty = False
+                try:
+                    self.save_state()
+                except Exception as e:
+                    print(f"❌ Error flushing bandit state: {e}")
+
+    def _flush_on_exit(self):
+        """Write any unflushed updates on clean shutdown"""
+        if self._dirty:
+            try:
+                self.save_state()
+            except Exception as e:
+                print(f"❌ Error saving bandit state at exit: {e}")
+
     def save_state(self, filepath="bandit_state.json"):
         """Save bandit state to file"""
         state = {
@@ -242,7 +301,8 @@ class EpsilonGreedyBandit:
             self.exploration_count = state.get('exploration_count', 0)
             self.exploitation_count = state.get('exploitation_count', 0)
             self.recent_rewards = state.get('recent_rewards', [])
-            
+            self._stats_version += 1  # Loaded state invalidates the snapshot
+
             print(f"📂 Bandit state loaded from {filepath}")
             print(f"   Interactions: {self.total_interactions}")
             print(f"   Chunks learned: {len(self.chunk_rewards)}")
@@ -8,10 +8,22 @@ class FeedbackDatabase:
         self.db_path = db_path
         self.init_database()
     
+    def _connect(self):
+        """Open a connection with the write-friendly pragmas applied"""
+        conn = sqlite3.connect(self.db_path)
+        # NORMAL skips the per-commit fsync that FULL pays; with WAL the
+        # database stays consistent and only the tail of the log is at risk
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
+
+        # WAL is persistent once set - writers append to the log instead of
+        # rewriting pages, and readers aren't blocked during commits
+        cursor.execute('PRAGMA journal_mode=WAL')
         
         # Create user_interactions table
         cursor.execute('''
@@ -88,7 +100,7 @@ class FeedbackDatabase:
     def log_interaction(self, session_id, query, video_id, chunk_start_time, chunk_end_time, 
                        chunk_text, relevance_score, action_type, time_spent=0):
         """Log user interaction with a chunk"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -105,7 +117,7 @@ class FeedbackDatabase:
     def save_chunk_rating(self, query, video_id, chunk_start_time, chunk_end_time, 
                          chunk_text, relevance_score, user_rating, session_id):
         """Save user rating for a chunk"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -119,9 +131,49 @@ class FeedbackDatabase:
         conn.commit()
         conn.close()
     
+    def save_chunk_ratings(self, rows):
+        """Save a batch of chunk ratings in one transaction
+
+        rows holds (query, video_id, chunk_start_time, chunk_end_time,
+        chunk_text, relevance_score, user_rating, session_id) tuples.
+        Amortizes the commit fsync across the batch.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.executemany('''
+            INSERT INTO chunk_ratings
+            (query, video_id, chunk_start_time, chunk_end_time, chunk_text,
+             relevance_score, user_rating, session_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+
+        conn.commit()
+        conn.close()
+
+    def log_interactions(self, rows):
+        """Log a batch of user interactions in one transaction
+
+        rows holds (session_id, query, video_id, chunk_start_time,
+        chunk_end_time, chunk_text, relevance_score, action_type,
+        time_spent) tuples.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.executemany('''
+            INSERT INTO user_interactions
+            (session_id, query, video_id, chunk_start_time, chunk_end_time,
+             chunk_text, relevance_score, action_type, time_spent)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+
+        conn.commit()
+        conn.close()
+
     def save_query_history(self, query, results_count, videos_count, avg_relevance_score, session_id):
         """Save query history"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -135,7 +187,7 @@ class FeedbackDatabase:
     
     def get_query_stats(self, query):
         """Get statistics for a specific query"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -158,7 +210,7 @@ class FeedbackDatabase:
     
     def get_chunk_feedback(self, video_id, chunk_start_time):
         """Get feedback for a specific chunk"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -179,7 +231,7 @@ class FeedbackDatabase:
     
     def get_popular_queries(self, limit=10):
         """Get most popular queries"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -198,7 +250,7 @@ class FeedbackDatabase:
     def save_judge_evaluation(self, query, video_id, scores, average_score, quality_level, 
                             trigger_decision, evaluation_time, llm_model='gemma:2b'):
         """Save LLM judge evaluation to database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -222,7 +274,7 @@ class FeedbackDatabase:
     
     def get_judge_statistics(self, days_back=7):
         """Get judge evaluation statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
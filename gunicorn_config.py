@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Gunicorn configuration for the YoutubeAgent transcript server
+
+Usage: gunicorn -c gunicorn_config.py wsgi:app
+
+The workload is I/O-bound (yt-dlp, VTT downloads, SQLite, W&B, Ollama),
+so gthread workers with a few threads each give near-linear concurrency.
+"""
+
+import os
+
+workers = 2 * (os.cpu_count() or 1) + 1
+threads = 4
+
+# self_learning sizes its torch thread pool as cpu_count / WEB_CONCURRENCY -
+# export the actual worker count so the per-worker budgets add up to the
+# machine instead of each worker assuming it shares with only one other
+os.environ.setdefault('WEB_CONCURRENCY', str(workers))
+worker_class = 'gthread'
+timeout = 120  # Fine-tuning triggers and cold yt-dlp fetches can run long
+
+# The app starts daemon threads at import time (feedback worker, W&B drain,
+# bandit state flusher, log queue listener) and threads don't survive fork -
+# with preload the master would import once and every forked worker would
+# accept feedback that nothing ever drains. Import per worker instead, so
+# each worker owns a live set of background threads.
+preload_app = False
+
+bind = '127.0.0.1:5000'
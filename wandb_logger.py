@@ -1,8 +1,45 @@
 import wandb
+import numpy as np
 import os
+import queue
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 import json
 
+# Timestamps on logged metrics only need flush-window resolution, so share one
+# time.time() result for up to 500ms instead of a syscall per payload
+_TS_CACHE = [0.0, 0.0]  # [monotonic stamp, wall-clock value]
+
+
+def _now_ts():
+    """Wall-clock timestamp, cached for the logging flush window"""
+    now = time.monotonic()
+    if now - _TS_CACHE[0] > 0.5:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = time.time()
+    return _TS_CACHE[1]
+
+
+@lru_cache(maxsize=4096)
+def _query_hash(query):
+    """Stable anonymous bucket for a query string"""
+    return hash(query) % 10000
+
+
+def _noop(*args, **kwargs):
+    """Stand-in for the logging methods when W&B is unavailable"""
+    return None
+
+
+# Metric keys for the top-chunk loop, built once instead of two f-string
+# allocations per chunk per rating
+_TOP_CHUNK_KEYS = tuple(
+    (f"bandit/top_chunk_{i + 1}_reward", f"bandit/top_chunk_{i + 1}_count")
+    for i in range(3)
+)
+
 class WandBLogger:
     """
     Weights & Biases logger for YoutubeAgent RL monitoring
@@ -15,9 +52,17 @@ class WandBLogger:
         self.run = None
         self.is_initialized = False
         self.step_counter = 0  # Track steps for time series
-        
+
+        # Metric dicts are queued here and coalesced into one run.log call per
+        # flush window by the drain thread - keeps W&B RPC latency and rate
+        # limits off the request path
+        self._log_q = queue.Queue()
+
         # Initialize W&B
         self.initialize()
+
+        self._drain_thread = threading.Thread(target=self._drain, daemon=True)
+        self._drain_thread.start()
     
     def initialize(self):
         """Initialize W&B run with persistence"""
@@ -50,6 +95,17 @@ class WandBLogger:
             else:
                 print("📊 No step counter file found, starting from 0")
             
+            # Disable the periodic system-metrics collector - it wakes every
+            # ~10s to sample CPU/GPU/disk and causes visible latency spikes on
+            # the serving process; none of those charts are used here
+            os.environ.setdefault("WANDB_X_STATS_SAMPLE_RATE_SECONDS", "0")
+            os.environ.setdefault("WANDB__DISABLE_STATS", "true")
+
+            # Bound the SDK's HTTP calls so a slow W&B backend can't stall
+            # startup or the flush thread indefinitely
+            os.environ.setdefault("WANDB_HTTP_TIMEOUT", "30")
+            os.environ.setdefault("WANDB_INIT_TIMEOUT", "30")
+
             # Initialize with persistent run ID
             self.run = wandb.init(
                 project=self.project_name,
@@ -74,6 +130,12 @@ class WandBLogger:
                 print(f"💾 Saved W&B run ID: {self.run.id}, step: {self.step_counter}")
             
             self.is_initialized = True
+
+            # Queue a startup ping so the drain thread's first flush happens
+            # now - the writer pays its TLS handshake at boot instead of
+            # in-band on the first rating after an idle period
+            self._enqueue({"startup/ping": 1})
+
             print("✅ W&B initialized successfully")
             
         except Exception as e:
@@ -81,7 +143,50 @@ class WandBLogger:
             print("🔄 Server continuing without W&B logging")
             self.is_initialized = False
             self.run = None
+
+            # Rebind the logging surface to no-ops - callers on the feedback
+            # path pay one empty call instead of building payloads that the
+            # per-method guards would throw away anyway
+            for name in dir(self):
+                if name.startswith('log_'):
+                    setattr(self, name, _noop)
     
+    def _enqueue(self, log_data):
+        """Queue a metric dict for the background drain thread"""
+        self._log_q.put(log_data)
+
+    def _drain(self):
+        """Coalesce queued metric dicts into one run.log call per flush window"""
+        while True:
+            item = self._log_q.get()
+            if item is None:  # Sentinel from finish()
+                break
+            # Let a burst accumulate, then merge everything queued so far into
+            # a single step - one filestream request instead of one per metric
+            time.sleep(0.5)
+            merged = dict(item)
+            try:
+                while True:
+                    extra = self._log_q.get_nowait()
+                    if extra is None:
+                        self._flush(merged)
+                        return
+                    merged.update(extra)
+            except queue.Empty:
+                pass
+            self._flush(merged)
+
+    def _flush(self, merged):
+        """Send one merged metric dict to W&B"""
+        if not merged or not self.run:
+            return
+        try:
+            self.step_counter += 1
+            self.run.log(merged, step=self.step_counter)
+            self._save_step_counter()
+        except Exception as e:
+            print(f"❌ W&B flush failed: {e}")
+
     def _save_step_counter(self):
         """Save current step counter to file"""
         try:
@@ -102,45 +207,80 @@ class WandBLogger:
                 "search/query_length": len(query),
                 "search/videos_found": video_count,
                 "search/chunks_generated": chunk_count,
-                "search/timestamp": datetime.now().timestamp(),
+                "search/timestamp": _now_ts(),
                 "search/query": query
             }
-            self.step_counter += 1
-            self.run.log(log_data, step=self.step_counter)
-            self._save_step_counter()
-            
+            self._enqueue(log_data)
+
         except Exception as e:
             print(f"❌ W&B search logging failed: {e}")
     
+    def _rating_payload(self, query, chunk_id, rating, relevance_score, bandit_score=None):
+        """Build the metric dict for one user rating"""
+        # Convert 1-5 rating to 0-1 reward
+        reward = (rating - 1) / 4.0
+
+        log_data = {
+            "feedback/user_rating": rating,
+            "feedback/reward": reward,
+            "feedback/relevance_score": relevance_score,
+            "feedback/rating_timestamp": _now_ts(),
+            "feedback/query_rating": f"{query}:{rating}",
+            "feedback/chunk_performance": f"{chunk_id[:8]}:{rating}"
+        }
+
+        if bandit_score is not None:
+            log_data["feedback/bandit_score"] = bandit_score
+        return log_data
+
+    def _bandit_payload(self, bandit_stats):
+        """Build the metric dict for a bandit stats snapshot"""
+        log_data = {
+            "bandit/total_interactions": bandit_stats.get('total_interactions', 0),
+            "bandit/chunks_learned": bandit_stats.get('chunks_learned', 0),
+            "bandit/avg_recent_reward": bandit_stats.get('avg_recent_reward', 0),
+            "bandit/current_epsilon": bandit_stats.get('current_epsilon', 0),
+            "bandit/exploration_rate": bandit_stats.get('exploration_rate', 0),
+            "bandit/exploitation_rate": bandit_stats.get('exploitation_rate', 0),
+            "bandit/queries_learned": bandit_stats.get('queries_learned', 0)
+        }
+
+        # Add best performing chunks to the same payload
+        best_chunks = bandit_stats.get('best_chunks', [])
+        if best_chunks:
+            for (reward_key, count_key), (chunk_id, avg_reward, count) in zip(
+                    _TOP_CHUNK_KEYS, best_chunks):
+                log_data[reward_key] = avg_reward
+                log_data[count_key] = count
+        return log_data
+
     def log_user_rating(self, query, chunk_id, rating, relevance_score, bandit_score=None):
         """Log user rating feedback"""
         if not self.is_initialized or not self.run:
             return
-        
+
         try:
-            # Convert 1-5 rating to 0-1 reward
-            reward = (rating - 1) / 4.0
-            
-            # Combine all logs into a single call to prevent multiple runs
-            log_data = {
-                "feedback/user_rating": rating,
-                "feedback/reward": reward,
-                "feedback/relevance_score": relevance_score,
-                "feedback/rating_timestamp": datetime.now().timestamp(),
-                "feedback/query_rating": f"{query}:{rating}",
-                "feedback/chunk_performance": f"{chunk_id[:8]}:{rating}"
-            }
-            
-            if bandit_score is not None:
-                log_data["feedback/bandit_score"] = bandit_score
-            
-            # Single log call to prevent race conditions
-            self.step_counter += 1
-            self.run.log(log_data, step=self.step_counter)
-            self._save_step_counter()
-            
+            self._enqueue(self._rating_payload(query, chunk_id, rating,
+                                               relevance_score, bandit_score))
+
         except Exception as e:
             print(f"❌ W&B rating logging failed: {e}")
+
+    def log_feedback_event(self, query, chunk_id, rating, relevance_score,
+                           bandit_stats, bandit_score=None):
+        """Log a rating and the updated bandit metrics as one committed step"""
+        if not self.is_initialized or not self.run:
+            return
+
+        try:
+            log_data = self._rating_payload(query, chunk_id, rating,
+                                            relevance_score, bandit_score)
+            if bandit_stats:
+                log_data.update(self._bandit_payload(bandit_stats))
+            self._enqueue(log_data)
+
+        except Exception as e:
+            print(f"❌ W&B feedback logging failed: {e}")
     
     def log_bandit_metrics(self, bandit_stats):
         """Log bandit performance metrics"""
@@ -148,28 +288,8 @@ class WandBLogger:
             return
         
         try:
-            # Combine all bandit metrics into single log call
-            log_data = {
-                "bandit/total_interactions": bandit_stats.get('total_interactions', 0),
-                "bandit/chunks_learned": bandit_stats.get('chunks_learned', 0),
-                "bandit/avg_recent_reward": bandit_stats.get('avg_recent_reward', 0),
-                "bandit/current_epsilon": bandit_stats.get('current_epsilon', 0),
-                "bandit/exploration_rate": bandit_stats.get('exploration_rate', 0),
-                "bandit/exploitation_rate": bandit_stats.get('exploitation_rate', 0),
-                "bandit/queries_learned": bandit_stats.get('queries_learned', 0)
-            }
-            
-            # Add best performing chunks to the same log call
-            best_chunks = bandit_stats.get('best_chunks', [])
-            if best_chunks:
-                for i, (chunk_id, avg_reward, count) in enumerate(best_chunks[:3]):
-                    log_data[f"bandit/top_chunk_{i+1}_reward"] = avg_reward
-                    log_data[f"bandit/top_chunk_{i+1}_count"] = count
-            
-            # Single log call for all bandit metrics
-            self.step_counter += 1
-            self.run.log(log_data, step=self.step_counter)
-            self._save_step_counter()
+            # Single queued payload for all bandit metrics
+            self._enqueue(self._bandit_payload(bandit_stats))
             print(f"✅ Logged bandit metrics to W&B: {bandit_stats.get('total_interactions', 0)} interactions, ε={bandit_stats.get('current_epsilon', 0):.3f}")
             
         except Exception as e:
@@ -184,12 +304,12 @@ class WandBLogger:
             total_selections = exploration_count + exploitation_count
             exploration_ratio = exploration_count / max(1, total_selections)
             
-            self.run.log({
+            self._enqueue({
                 "selection/chunks_selected": chunks_selected,
                 "selection/exploration_count": exploration_count,
                 "selection/exploitation_count": exploitation_count,
                 "selection/exploration_ratio": exploration_ratio,
-                "selection/timestamp": datetime.now().timestamp()
+                "selection/timestamp": _now_ts()
             })
             
         except Exception as e:
@@ -210,8 +330,8 @@ class WandBLogger:
             
             if learning_rate:
                 log_data["learning/learning_rate"] = learning_rate
-            
-            self.run.log(log_data)
+
+            self._enqueue(log_data)
             
         except Exception as e:
             print(f"❌ W&B learning logging failed: {e}")
@@ -225,13 +345,13 @@ class WandBLogger:
             log_data = {
                 "query_performance/avg_rating": avg_rating,
                 "query_performance/interaction_count": interaction_count,
-                "query_performance/query_hash": hash(query) % 10000  # Anonymous query tracking
+                "query_performance/query_hash": _query_hash(query)  # Anonymous query tracking
             }
             
             if improvement_rate:
                 log_data["query_performance/improvement_rate"] = improvement_rate
-            
-            self.run.log(log_data)
+
+            self._enqueue(log_data)
             
         except Exception as e:
             print(f"❌ W&B query performance logging failed: {e}")
@@ -244,15 +364,15 @@ class WandBLogger:
         try:
             log_data = {
                 "system/response_time_ms": response_time * 1000,
-                "system/timestamp": datetime.now().timestamp()
+                "system/timestamp": _now_ts()
             }
             
             if memory_usage:
                 log_data["system/memory_usage_mb"] = memory_usage
             if cpu_usage:
                 log_data["system/cpu_usage_percent"] = cpu_usage
-            
-            self.run.log(log_data)
+
+            self._enqueue(log_data)
             
         except Exception as e:
             print(f"❌ W&B system logging failed: {e}")
@@ -312,11 +432,13 @@ class WandBLogger:
         return dashboard_config
     
     def _calculate_variance(self, values):
-        """Calculate variance of a list of values"""
-        if not values:
+        """Calculate variance of a list or array of values"""
+        # np.var does one vectorized pass instead of the two Python-level
+        # loops (mean, then squared deviations); asarray passes ndarray
+        # inputs through without copying
+        if len(values) == 0:
             return 0
-        mean = sum(values) / len(values)
-        return sum((x - mean) ** 2 for x in values) / len(values)
+        return float(np.var(np.asarray(values, dtype=np.float64)))
     
     def log_model_update(self, version, model_path):
         """Log model update to W&B"""
@@ -324,9 +446,9 @@ class WandBLogger:
             return
         
         try:
-            self.run.log({
+            self._enqueue({
                 "model/version": version,
-                "model/update_timestamp": datetime.now().timestamp(),
+                "model/update_timestamp": _now_ts(),
                 "model/path": model_path
             })
         except Exception as e:
@@ -338,8 +460,8 @@ class WandBLogger:
             return
         
         try:
-            self.run.log({
-                "fine_tuning/start_timestamp": datetime.now().timestamp(),
+            self._enqueue({
+                "fine_tuning/start_timestamp": _now_ts(),
                 "fine_tuning/training_samples": training_samples,
                 "fine_tuning/eval_samples": eval_samples,
                 "fine_tuning/status": "started"
@@ -353,11 +475,11 @@ class WandBLogger:
             return
         
         try:
-            self.run.log({
+            self._enqueue({
                 "fine_tuning/epoch": epoch,
                 "fine_tuning/training_loss": loss,
                 "fine_tuning/eval_score": eval_score,
-                "fine_tuning/progress_timestamp": datetime.now().timestamp()
+                "fine_tuning/progress_timestamp": _now_ts()
             })
         except Exception as e:
             print(f"❌ W&B fine-tuning progress logging failed: {e}")
@@ -368,11 +490,11 @@ class WandBLogger:
             return
         
         try:
-            self.run.log({
+            self._enqueue({
                 "fine_tuning/final_eval_score": final_eval_score,
                 "fine_tuning/deployed": deployed,
                 "fine_tuning/improvement": improvement,
-                "fine_tuning/completion_timestamp": datetime.now().timestamp(),
+                "fine_tuning/completion_timestamp": _now_ts(),
                 "fine_tuning/status": "completed"
             })
         except Exception as e:
@@ -384,7 +506,7 @@ class WandBLogger:
             return
         
         try:
-            self.run.log({
+            log_data = {
                 "judge/average_score": average_score,
                 "judge/quality_level": quality_level,
                 "judge/trigger_decision": trigger_decision,
@@ -392,13 +514,15 @@ class WandBLogger:
                 "judge/num_results": len(judge_scores),
                 "judge/min_score": min(judge_scores) if judge_scores else 0,
                 "judge/max_score": max(judge_scores) if judge_scores else 0,
-                "judge/timestamp": datetime.now().timestamp()
-            })
-            
-            # Log individual scores as a histogram
+                "judge/timestamp": _now_ts()
+            }
+
+            # Individual scores go in as one histogram rather than one metric
+            # key (and one RPC) per result
             if judge_scores:
-                for i, score in enumerate(judge_scores):
-                    self.run.log({f"judge/result_{i+1}_score": score})
+                log_data["judge/result_scores"] = wandb.Histogram(judge_scores)
+
+            self._enqueue(log_data)
                     
         except Exception as e:
             print(f"❌ W&B judge evaluation logging failed: {e}")
@@ -407,6 +531,9 @@ class WandBLogger:
         """Finish W&B run"""
         if self.is_initialized and self.run:
             try:
+                # Stop the drain thread and flush anything still queued
+                self._log_q.put(None)
+                self._drain_thread.join(timeout=2)
                 wandb.finish()
                 print("✅ W&B run finished")
             except Exception as e:
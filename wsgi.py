@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the YoutubeAgent transcript server
+
+Run under a production server instead of the Werkzeug dev server so
+transcript downloads, embedding and ranking can overlap across clients:
+
+    gunicorn -c gunicorn_config.py wsgi:app
+
+Don't use --preload: the app starts daemon threads at import time
+(feedback worker, W&B drain, bandit flusher, log listener) and those
+don't survive the fork. `python transcript_server.py` still works for
+local development.
+"""
+
+from transcript_server import app
+
+if __name__ == "__main__":
+    app.run(host='127.0.0.1', port=5000)